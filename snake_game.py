@@ -3,14 +3,27 @@ Vibrant Snake - A modern and kid-friendly implementation of the classic Snake ga
 This single file contains all the game logic, including the engine, entities, UI, and assets.
 """
 import pygame
+import numpy as np
 import sys
 import os
 import json
+import copy
+import queue
 import random
 import math
-from typing import Dict, Tuple, Optional, List, Callable
+import threading
+from collections import Counter, deque
+from itertools import islice
+from typing import Dict, Tuple, Optional, List, Callable, Union
 from datetime import datetime
 
+try:
+    from numba import njit # Optional: compiles the particle update loop
+except ImportError:
+    njit = None
+
+rng = np.random.default_rng()  # Shared generator for all batched (array) random draws
+
 # --- CONFIGURATION CONSTANTS ---
 
 # Screen and Grid
@@ -20,6 +33,14 @@ TILE_SIZE = 32
 GRID_WIDTH = 25
 GRID_HEIGHT = 15
 FPS = 60
+MENU_IDLE_WAIT = 100  # ms an idle menu sleeps waiting for input; menus over the star field redraw at this rate
+FRAME_BUDGET = 1000 / FPS
+STALL_PAUSE_MS = 1500  # A frame this long (window dragged, laptop resumed) pauses the game
+Cell = Tuple[int, int]  # A (column, row) position on the grid
+# Pixel offset of every column/row. The extra trailing entries (index GRID_WIDTH, and -1 via
+# negative indexing) cover a head that has just left the grid on the game over frame.
+GRID_X_PIXELS = tuple(x * TILE_SIZE for x in range(GRID_WIDTH + 1)) + (-TILE_SIZE,)
+GRID_Y_PIXELS = tuple(y * TILE_SIZE for y in range(GRID_HEIGHT + 1)) + (-TILE_SIZE,)
 
 # --- THEME & DESIGN CONSTANTS ---
 # A more playful and vibrant color palette for the redesign.
@@ -53,7 +74,17 @@ DIFFICULTY_LEVELS = {
     'Normal': {'speed': 12, 'powerup_spawn_rate': 10000},
     'Hard': {'speed': 18, 'powerup_spawn_rate': 7000}
 }
+_DIFF_KEYS = tuple(DIFFICULTY_LEVELS)  # Cycle order for the difficulty toggle
 COMBO_WINDOW = 10000  # 10 seconds in milliseconds
+COMBO_THRESHOLD = 3   # foods eaten within the window to trigger a combo
+COMBO_BONUS = 30      # flat bonus points awarded per combo
+
+# Controls: key -> (dx, dy) grid direction
+KEY_DIRECTIONS = {
+    pygame.K_UP: (0, -1), pygame.K_w: (0, -1), pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1),
+    pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0), pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+}
+HANDLED_EVENTS = frozenset((pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
 
 # Effects
 SCREEN_SHAKE_DURATION = 120  # ms
@@ -86,12 +117,15 @@ class AssetManager:
     """A class to manage all game assets."""
     def __init__(self):
         self.snake_skins: Dict[str, Dict[str, pygame.Surface]] = {}
+        self.skin_colors: Dict[str, Dict] = {}
         self.food_surfaces: Dict[str, pygame.Surface] = {}
         self.power_up_surfaces: Dict[str, pygame.Surface] = {}
+        self.tile_surfaces: Dict[str, pygame.Surface] = {}
         self.ui_icons: Dict[str, pygame.Surface] = {}
+        self.particle_sprites: Dict[tuple, pygame.Surface] = {}
         self.sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
         self.fonts: Dict[str, Optional[pygame.font.Font]] = {}
-        self.backgrounds: Dict[str, List] = {}
+        self.backgrounds: Dict[str, Union[pygame.Surface, np.ndarray, List, Dict]] = {}
         self.load_assets()
 
     def load_assets(self) -> None:
@@ -100,11 +134,22 @@ class AssetManager:
         self.create_snake_skins()
         self.create_food_surfaces()
         self.create_power_up_surfaces()
+        self.create_tile_surfaces()
         self.create_ui_icons()
+        self.create_particle_sprites()
         self.create_sounds()
         self.create_backgrounds()
         self.generate_sprite_preview()
 
+    def finalize_surfaces(self) -> None:
+        """Converts all sprites to the display's pixel format. Requires an initialized display."""
+        for skin in self.snake_skins.values():
+            for name, surf in skin.items(): skin[name] = surf.convert_alpha()
+        for surfaces in (self.food_surfaces, self.power_up_surfaces, self.tile_surfaces, self.ui_icons, self.particle_sprites,
+                         self.backgrounds['star_sprites']):
+            for name, surf in surfaces.items(): surfaces[name] = surf.convert_alpha()
+        self.backgrounds['sky'] = self.backgrounds['sky'].convert()
+
     def load_fonts(self):
         """Loads a custom font if available, otherwise falls back to default."""
         custom_font_path = 'assets/Fredoka-Regular.ttf'
@@ -127,9 +172,19 @@ class AssetManager:
             "Tiger": {"head": (255, 165, 0), "body": (255, 140, 0), "pattern": (0,0,0)},
             "Rainbow": {"head": (255, 0, 0), "body": "rainbow"},
         }
+        self.skin_colors = skins
+        # Colorblind variants are built on first use by get_snake_skin
         for name, colors in skins.items():
             self.snake_skins[name] = self._create_snake_surfaces(colors)
-            self.snake_skins[name + " (CB)"] = self._create_snake_surfaces(colors, color_blind_mode=True)
+
+    def get_snake_skin(self, skin: str, color_blind_mode: bool = False) -> Dict[str, pygame.Surface]:
+        """Returns the surfaces for a skin, creating its colorblind variant when first needed."""
+        skin_name = skin + " (CB)" if color_blind_mode else skin
+        surfaces = self.snake_skins.get(skin_name)
+        if surfaces is None:
+            surfaces = self._create_snake_surfaces(self.skin_colors[skin], color_blind_mode=True)
+            surfaces = self.snake_skins[skin_name] = {name: surf.convert_alpha() for name, surf in surfaces.items()}
+        return surfaces
 
     def _create_snake_surfaces(self, colors: Dict, color_blind_mode: bool = False) -> Dict:
         """Creates stylized surfaces for a single snake skin."""
@@ -196,6 +251,12 @@ class AssetManager:
             surf.blit(text_surf, text_rect)
             self.power_up_surfaces[name] = surf
             
+    def create_tile_surfaces(self) -> None:
+        """Pre-renders the rounded bouncy wall tile."""
+        wall_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        pygame.draw.rect(wall_surf, PALETTE['bouncy_wall'], wall_surf.get_rect(), border_radius=5)
+        self.tile_surfaces['bouncy_wall'] = wall_surf
+
     def create_ui_icons(self) -> None:
         """Generates simple UI icons."""
         mute_surf = pygame.Surface((48, 48), pygame.SRCALPHA)
@@ -203,6 +264,33 @@ class AssetManager:
         pygame.draw.line(mute_surf, PALETTE['accent2'], (8, 8), (40, 40), 4)
         self.ui_icons['mute'] = mute_surf
 
+    def create_particle_sprites(self) -> None:
+        """Pre-renders the particle dots for every food color, radius and alpha tier."""
+        for config in FOOD_TYPES.values():
+            for radius in range(1, 10):
+                for alpha_tier in range(8):
+                    self.particle_sprites[(config['color'], radius, alpha_tier)] = self._create_particle_sprite(config['color'], radius, alpha_tier)
+
+    def get_particle_sprite(self, color: Tuple[int, int, int], radius: int, alpha_tier: int) -> pygame.Surface:
+        """Returns a 12x12 particle dot.
+
+        Pre-rendered colors match exactly; any other color is snapped to the middle of its
+        16-step bucket per channel, so arbitrary colors can't grow the cache without bound.
+        """
+        sprite = self.particle_sprites.get((color, radius, alpha_tier))
+        if sprite is None:
+            color = tuple((c & 0xF0) | 0x08 for c in color)
+            key = (color, radius, alpha_tier)
+            sprite = self.particle_sprites.get(key)
+            if sprite is None:
+                sprite = self.particle_sprites[key] = self._create_particle_sprite(color, radius, alpha_tier).convert_alpha()
+        return sprite
+
+    def _create_particle_sprite(self, color: Tuple[int, int, int], radius: int, alpha_tier: int) -> pygame.Surface:
+        sprite = pygame.Surface((12, 12), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color + ((alpha_tier << 5) | 31,), (6, 6), radius)
+        return sprite
+
     def create_sounds(self) -> None:
         """Loads sound effects from the assets folder."""
         sound_files = {
@@ -225,9 +313,24 @@ class AssetManager:
                 print(f"Could not load sound '{filename}': {e}")
     
     def create_backgrounds(self):
-        self.backgrounds['stars'] = [[random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT), random.randint(1, 3)] for _ in range(100)]
+        """Bakes the static starfield into one surface; only a few drifting stars are drawn per frame."""
+        sky = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        sky.fill(PALETTE['background'])
+        for _ in range(90):
+            pygame.draw.circle(sky, (255, 255, 255), (random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT)), random.randint(1, 3))
+        self.backgrounds['sky'] = sky
+        # Drifting stars as parallel arrays: x, y and size (radius, which doubles as speed)
+        self.backgrounds['star_x'] = rng.integers(0, SCREEN_WIDTH + 1, 10).astype(np.float32)
+        self.backgrounds['star_y'] = rng.integers(0, SCREEN_HEIGHT + 1, 10)
+        self.backgrounds['star_size'] = rng.integers(1, 4, 10)
+        self.backgrounds['star_sprites'] = {radius: self._create_star_sprite(radius) for radius in range(1, 4)}
         self.backgrounds['nebula'] = [] # Can be implemented later
 
+    def _create_star_sprite(self, radius: int) -> pygame.Surface:
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (255, 255, 255), (radius, radius), radius)
+        return sprite
+
     def generate_sprite_preview(self) -> None:
         """Generates a preview image of key sprites."""
         preview_surface = pygame.Surface((256, 128), pygame.SRCALPHA)
@@ -237,12 +340,20 @@ class AssetManager:
         preview_surface.blit(self.food_surfaces['apple'], (20, 70))
         preview_surface.blit(self.food_surfaces['banana'], (20 + TILE_SIZE + 5, 70))
         preview_surface.blit(self.power_up_surfaces['slimy'], (20 + 2*(TILE_SIZE + 5), 70))
+        # Only the disk write runs off the main thread; the surface is fully composed by now
+        threading.Thread(target=self._save_sprite_preview, args=(preview_surface,), daemon=True).start()
+
+    def _save_sprite_preview(self, preview_surface: pygame.Surface) -> None:
         try:
             if not os.path.exists('assets'): os.makedirs('assets')
-            pygame.image.save(preview_surface, 'assets/preview.png')
+            # The thread may be cut off at exit, so only a finished image ever replaces the old one
+            pygame.image.save(preview_surface, 'assets/preview.tmp.png')
+            os.replace('assets/preview.tmp.png', 'assets/preview.png')
             print("Generated assets/preview.png")
         except Exception as e:
             print(f"Could not save sprite preview: {e}")
+            try: os.remove('assets/preview.tmp.png')
+            except OSError: pass
 
 
 # --- GAME ENTITIES ---
@@ -250,125 +361,203 @@ class Snake:
     """Represents the snake entity."""
     def __init__(self, play_area: pygame.Rect):
         self.play_area = play_area
-        self.body: List[pygame.Vector2] = [pygame.Vector2(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
-        self.direction = pygame.Vector2(0, 0)
+        self.body: deque[Cell] = deque([(GRID_WIDTH // 2, GRID_HEIGHT // 2)])
+        self.occupied: Counter[Cell] = Counter(self.body) # segments per cell; slimy lets them overlap
+        self.direction: Cell = (0, 0)
         self.new_block = False
         self.active_power_ups: dict[str, int] = {}
+        self.next_power_up_expiry = math.inf
         self.eye_state = 'normal' # normal, wide, dizzy
         self.dizzy_timer = 0
 
-    def update(self) -> None:
-        """Updates the snake's position."""
-        if self.direction.length() == 0: return
+    def update(self) -> Optional[Tuple[Cell, Optional[Cell]]]:
+        """Updates the snake's position.
+
+        Returns the cell entered by the head and the cell vacated by the tail
+        (None when growing or still covered), or None if the snake is not moving.
+        """
+        if self.direction == (0, 0): return None
         
         if self.dizzy_timer > 0:
             self.dizzy_timer -= 1
             if self.dizzy_timer == 0: self.eye_state = 'normal'
 
-        body_copy = self.body[:] if self.new_block else self.body[:-1]
-        self.new_block = False
-        new_head = self.body[0] + self.direction
-        self.body = [new_head] + body_copy
+        new_head = (self.body[0][0] + self.direction[0], self.body[0][1] + self.direction[1])
+        freed = None
+        if self.new_block:
+            self.new_block = False
+        else:
+            tail = self.body.pop()
+            self.occupied[tail] -= 1
+            if self.occupied[tail] == 0:
+                del self.occupied[tail]; freed = tail
+        self.body.appendleft(new_head)
+        self.occupied[new_head] += 1
+        if freed == new_head: freed = None
+        return new_head, freed
 
     def grow(self): self.new_block = True
-    def get_head_position(self): return self.body[0]
+    def get_head_position(self) -> Cell: return self.body[0]
     def get_head_pixel_pos(self, origin: Tuple[int, int]):
-        return (origin[0] + self.body[0].x * TILE_SIZE + TILE_SIZE / 2,
-                origin[1] + self.body[0].y * TILE_SIZE + TILE_SIZE / 2)
+        return (origin[0] + self.body[0][0] * TILE_SIZE + TILE_SIZE / 2,
+                origin[1] + self.body[0][1] * TILE_SIZE + TILE_SIZE / 2)
 
-    def check_collision(self, bouncy_walls: List) -> Optional[str]:
+    def check_collision(self, bouncy_walls: frozenset[Cell]) -> Optional[str]:
         """Checks for collisions with walls or self."""
         head = self.get_head_position()
         if head in bouncy_walls:
             return "bounce"
-        if not (0 <= head.x < GRID_WIDTH and 0 <= head.y < GRID_HEIGHT):
+        if not (0 <= head[0] < GRID_WIDTH and 0 <= head[1] < GRID_HEIGHT):
             return "wall"
-        if head in self.body[1:] and 'slimy' not in self.active_power_ups:
+        if self.occupied[head] > 1 and 'slimy' not in self.active_power_ups:
             return "self"
         return None
 
     def draw(self, surface: pygame.Surface, assets: AssetManager, origin: Tuple, offset: Tuple, skin: str, cb_mode: bool):
-        skin_name = skin + " (CB)" if cb_mode else skin
-        skin_assets = assets.snake_skins[skin_name]
+        skin_assets = assets.get_snake_skin(skin, cb_mode)
         
         head_surface = skin_assets[f'head_{self.eye_state}_eyes']
         body_surface = skin_assets['body']
 
-        for i, segment in enumerate(self.body):
-            rect = pygame.Rect(origin[0] + offset[0] + int(segment.x * TILE_SIZE),
-                                origin[1] + offset[1] + int(segment.y * TILE_SIZE),
-                                TILE_SIZE, TILE_SIZE)
-            surface.blit(head_surface if i == 0 else body_surface, rect)
+        ox, oy = origin[0] + offset[0], origin[1] + offset[1]
+        surface.blits([(body_surface, (ox + GRID_X_PIXELS[x], oy + GRID_Y_PIXELS[y])) for x, y in islice(self.body, 1, None)], doreturn=False)
+        head_x, head_y = self.body[0]
+        surface.blit(head_surface, (ox + GRID_X_PIXELS[head_x], oy + GRID_Y_PIXELS[head_y]))
         
-    def add_power_up(self, power_up_type: str):
+    def add_power_up(self, power_up_type: str, now: int):
         duration = POWER_UP_CONFIG[power_up_type]['duration']
-        self.active_power_ups[power_up_type] = pygame.time.get_ticks() + duration
-
-    def update_power_ups(self):
-        current_time = pygame.time.get_ticks()
-        expired = [ptype for ptype, end_time in self.active_power_ups.items() if current_time >= end_time]
-        for ptype in expired: del self.active_power_ups[ptype]
+        self.active_power_ups[power_up_type] = now + duration
+        self.next_power_up_expiry = min(self.active_power_ups.values())
+
+    def update_power_ups(self, current_time: int):
+        """Drops expired power-ups; a no-op until the earliest one runs out."""
+        if current_time < self.next_power_up_expiry: return
+        for ptype, end_time in list(self.active_power_ups.items()):
+            if current_time >= end_time: del self.active_power_ups[ptype]
+        self.next_power_up_expiry = min(self.active_power_ups.values(), default=math.inf)
+
+def random_free_cell(free_cells: set[Cell], excluded: Tuple[Cell, ...] = ()) -> Optional[Cell]:
+    """Picks a random free cell, rejection-sampling the grid while the board is sparse."""
+    if len(free_cells) < 64:
+        candidates = tuple(free_cells.difference(excluded))
+        return random.choice(candidates) if candidates else None
+    while True:
+        cell = (random.randrange(GRID_WIDTH), random.randrange(GRID_HEIGHT))
+        if cell in free_cells and cell not in excluded:
+            return cell
 
 class Food:
     """Represents the food entity."""
-    def __init__(self, play_area: pygame.Rect, snake_body: List[pygame.Vector2]):
-        self.position = pygame.Vector2(0, 0)
+    def __init__(self, play_area: pygame.Rect, free_cells: set[Cell]):
+        self.position: Cell = (0, 0)
         self.type = 'apple'
         self.color = FOOD_TYPES[self.type]['color']
-        self.randomize_position(snake_body)
+        self.randomize_position(free_cells)
 
-    def randomize_position(self, snake_body: List[pygame.Vector2]):
+    def randomize_position(self, free_cells: set[Cell], excluded: Tuple[Cell, ...] = ()):
         self.type = random.choice(list(FOOD_TYPES.keys()))
         self.color = FOOD_TYPES[self.type]['color']
-        available_pos = [pygame.Vector2(x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT) if pygame.Vector2(x,y) not in snake_body]
-        if available_pos: self.position = random.choice(available_pos)
+        cell = random_free_cell(free_cells, excluded)
+        if cell: self.position = cell
 
     def draw(self, surface: pygame.Surface, assets: AssetManager, origin: Tuple, offset: Tuple):
-        rect = pygame.Rect(origin[0] + offset[0] + int(self.position.x * TILE_SIZE),
-                            origin[1] + offset[1] + int(self.position.y * TILE_SIZE),
-                            TILE_SIZE, TILE_SIZE)
-        surface.blit(assets.food_surfaces[self.type], rect)
+        surface.blit(assets.food_surfaces[self.type], (origin[0] + offset[0] + GRID_X_PIXELS[self.position[0]],
+                                                       origin[1] + offset[1] + GRID_Y_PIXELS[self.position[1]]))
 
 class PowerUp:
     """Represents a power-up item."""
-    def __init__(self, play_area: pygame.Rect, occupied: List[pygame.Vector2]):
+    def __init__(self, play_area: pygame.Rect, free_cells: set[Cell], excluded: Tuple[Cell, ...] = ()):
         self.type = random.choice(list(POWER_UP_CONFIG.keys()))
         self.config = POWER_UP_CONFIG[self.type]
-        self.position = pygame.Vector2(0,0)
-        self.randomize_position(occupied)
+        self.position: Cell = (0, 0)
+        self.randomize_position(free_cells, excluded)
     
-    def randomize_position(self, occupied: List[pygame.Vector2]):
-        available_pos = [pygame.Vector2(x,y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT) if pygame.Vector2(x,y) not in occupied]
-        if available_pos: self.position = random.choice(available_pos)
+    def randomize_position(self, free_cells: set[Cell], excluded: Tuple[Cell, ...] = ()):
+        cell = random_free_cell(free_cells, excluded)
+        if cell: self.position = cell
     
     def draw(self, surface: pygame.Surface, assets: AssetManager, origin: Tuple, offset: Tuple):
-        rect = pygame.Rect(origin[0] + offset[0] + int(self.position.x * TILE_SIZE),
-                            origin[1] + offset[1] + int(self.position.y * TILE_SIZE),
-                            TILE_SIZE, TILE_SIZE)
-        surface.blit(assets.power_up_surfaces[self.type], rect)
-
-class Particle:
-    """A simple particle for effects."""
-    def __init__(self, pos: Tuple[float, float], color: Tuple[int, int, int], lifespan: int = 45):
-        self.pos = list(pos)
-        self.color = color
-        self.vel = [random.uniform(-4, 4), random.uniform(-5, -1)]
-        self.lifespan = random.randint(lifespan - 15, lifespan + 15)
-        self.max_lifespan = self.lifespan
-        self.alive = True
-    
+        surface.blit(assets.power_up_surfaces[self.type], (origin[0] + offset[0] + GRID_X_PIXELS[self.position[0]],
+                                                           origin[1] + offset[1] + GRID_Y_PIXELS[self.position[1]]))
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def step_particles(pos, vel, life, max_life, color, n):
+        """Moves the first n particles and compacts the survivors in one compiled pass.
+
+        Returns the number of particles still alive.
+        """
+        live = 0
+        for i in range(n):
+            if life[i] <= 1: continue # Expires this frame
+            pos[live, 0] = pos[i, 0] + vel[i, 0]
+            pos[live, 1] = pos[i, 1] + vel[i, 1]
+            vel[live, 0] = vel[i, 0]
+            vel[live, 1] = vel[i, 1] + 0.1 # Gravity
+            life[live] = life[i] - 1
+            max_life[live] = max_life[i]
+            color[live, 0] = color[i, 0]; color[live, 1] = color[i, 1]; color[live, 2] = color[i, 2]
+            live += 1
+        return live
+else:
+    step_particles = None
+
+class ParticleSystem:
+    """Particles for effects, stored as parallel NumPy arrays and updated in bulk."""
+    def __init__(self, capacity: int = 1024):
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.life = np.zeros(capacity, np.int16)
+        self.max_life = np.zeros(capacity, np.int16)
+        self.color = np.zeros((capacity, 3), np.uint8)
+        self.n = 0
+        if step_particles is not None: # Compile (or load from cache) now rather than on the first game frame
+            step_particles(self.pos, self.vel, self.life, self.max_life, self.color, 0)
+
+    def __len__(self): return self.n
+    def clear(self): self.n = 0
+
+    def spawn(self, pos, color, count: int, lifespan: int = 45):
+        """Emits up to `count` particles, dropping any that exceed the capacity.
+
+        `pos` and `color` are either shared by the whole burst or given per particle
+        as arrays of shape (count, 2) and (count, 3).
+        """
+        count = min(count, len(self.life) - self.n)
+        if count <= 0: return
+        new = slice(self.n, self.n + count)
+        self.pos[new] = pos[:count] if isinstance(pos, np.ndarray) else pos
+        self.vel[new] = rng.uniform((-4, -5), (4, -1), (count, 2)) # Sideways spread, upward kick
+        self.life[new] = rng.integers(lifespan - 15, lifespan + 16, count)
+        self.max_life[new] = self.life[new]
+        self.color[new] = color[:count] if isinstance(color, np.ndarray) else color
+        self.n += count
+
     def update(self):
-        self.pos[0] += self.vel[0]
-        self.pos[1] += self.vel[1]
-        self.vel[1] += 0.1 # Gravity
-        self.lifespan -= 1
-        if self.lifespan <= 0: self.alive = False
-    
-    def draw(self, surface: pygame.Surface, offset: Tuple[int, int]):
-        alpha = int(255 * (self.lifespan / self.max_lifespan))
-        temp_surf = pygame.Surface((12, 12), pygame.SRCALPHA)
-        pygame.draw.circle(temp_surf, self.color + (alpha,), (6, 6), self.lifespan / 8)
-        surface.blit(temp_surf, (self.pos[0] + offset[0] - 6, self.pos[1] + offset[1] - 6))
+        n = self.n
+        if step_particles is not None:
+            self.n = step_particles(self.pos, self.vel, self.life, self.max_life, self.color, n)
+            return
+        self.pos[:n] += self.vel[:n]
+        self.vel[:n, 1] += 0.1 # Gravity
+        self.life[:n] -= 1
+        alive = self.life[:n] > 0
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            # Compact the surviving particles to the front of the arrays
+            for arr in (self.pos, self.vel, self.life, self.max_life, self.color):
+                arr[:live] = arr[:n][alive]
+            self.n = live
+
+    def draw(self, surface: pygame.Surface, assets: AssetManager, offset: Tuple[int, int]):
+        n = self.n
+        if n == 0: return
+        alpha_tiers = (self.life[:n] / self.max_life[:n] * 255).astype(np.int32) >> 5
+        radii = np.minimum(self.life[:n] // 8, 9) # 9+ already covers the whole 12x12 sprite
+        ox, oy = offset[0] - 6, offset[1] - 6
+        surface.blits([(assets.get_particle_sprite(tuple(color), radius, alpha_tier), (x + ox, y + oy))
+                       for (x, y), color, alpha_tier, radius in zip(self.pos[:n].tolist(), self.color[:n].tolist(), alpha_tiers.tolist(), radii.tolist())
+                       if radius >= 1], doreturn=False)
 
 # --- UI MANAGER ---
 
@@ -384,6 +573,18 @@ class Button:
         self.is_clicked = False
         self.scale = 1.0
         self.enabled = enabled
+        self._scaled_rect = self.rect.copy()
+        self._rect_scale = 1.0
+
+    @property
+    def text(self) -> str: return self._text
+    @text.setter
+    def text(self, value: str): self._text = value; self._text_surf = None
+
+    @property
+    def enabled(self) -> bool: return self._enabled
+    @enabled.setter
+    def enabled(self, value: bool): self._enabled = value; self._text_surf = None
 
     def handle_event(self, event: pygame.event.Event):
         if not self.enabled: return
@@ -397,45 +598,79 @@ class Button:
             self.is_clicked = False
         elif event.type == pygame.MOUSEBUTTONUP: self.is_clicked = False
     
+    def target_scale(self) -> float:
+        return 1.05 if self.is_hovered and not self.is_clicked and self.enabled else 1.0
+
+    def is_animating(self) -> bool: return self.scale != self.target_scale()
+
     def update(self):
-        """Animates the button scale."""
-        if self.is_hovered and not self.is_clicked and self.enabled:
-            self.scale += (1.05 - self.scale) * 0.2
-        else:
-            self.scale += (1.0 - self.scale) * 0.2
+        """Animates the button scale, settling exactly on the target once it's close enough."""
+        target = self.target_scale()
+        if self.scale == target: return
+        self.scale += (target - self.scale) * 0.2
+        if abs(target - self.scale) < 0.002: self.scale = target
 
     def draw(self, surface: pygame.Surface):
         self.update()
-        scaled_rect = pygame.Rect(0,0, int(self.rect.width * self.scale), int(self.rect.height * self.scale))
-        scaled_rect.center = self.rect.center
+        if self.scale != self._rect_scale:
+            self._scaled_rect = pygame.Rect(0,0, int(self.rect.width * self.scale), int(self.rect.height * self.scale))
+            self._scaled_rect.center = self.rect.center
+            self._rect_scale = self.scale
+        scaled_rect = self._scaled_rect
         
         color = PALETTE['button_hover'] if self.is_hovered else PALETTE['button_normal']
         if not self.enabled: color = (80, 80, 80)
         
         pygame.draw.rect(surface, PALETTE['shadow'], scaled_rect.move(0, 5), border_radius=15)
         pygame.draw.rect(surface, color, scaled_rect, border_radius=15)
-        text_surf = self.font.render(self.text, True, PALETTE['text_light'] if self.enabled else (150,150,150))
-        surface.blit(text_surf, text_surf.get_rect(center=scaled_rect.center))
+        if self._text_surf is None:
+            self._text_surf = self.font.render(self.text, True, PALETTE['text_light'] if self.enabled else (150,150,150)).convert_alpha()
+        surface.blit(self._text_surf, self._text_surf.get_rect(center=scaled_rect.center))
 
 class UIManager:
     """Manages all UI components and screens."""
     def __init__(self, assets: AssetManager):
         self.assets = assets
         self.buttons: list[Button] = []
+        self._text_cache: dict[tuple, pygame.Surface] = {}
+        # Warm the HUD glyphs so the first frames of a game don't rasterize every digit
+        for font_name, label in (('body', "Score: "), ('small', "Best: ")):
+            for text in (label, *"0123456789"): self._render_cached(assets.fonts[font_name], text, PALETTE['text_light'])
 
     def clear_buttons(self): self.buttons.clear()
+    def is_animating(self) -> bool: return any(button.is_animating() for button in self.buttons)
     def handle_events(self, event: pygame.event.Event):
         for button in self.buttons: button.handle_event(event)
 
+    def _render_cached(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Renders text once and reuses the surface; the oldest entry is evicted when full."""
+        key = (id(font), text, color)
+        text_surf = self._text_cache.get(key)
+        if text_surf is None:
+            if len(self._text_cache) >= 256: del self._text_cache[next(iter(self._text_cache))]
+            text_surf = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return text_surf
+
     def _draw_text(self, screen: pygame.Surface, text: str, font: pygame.font.Font,
                    pos: tuple, color, center: bool = True):
-        text_surf = font.render(text, True, color)
+        text_surf = self._render_cached(font, text, color)
         text_rect = text_surf.get_rect(center=pos) if center else text_surf.get_rect(topleft=pos)
         screen.blit(text_surf, text_rect)
 
-    def draw_playing_ui(self, screen: pygame.Surface, score: int, high_score: int, snake: Snake, mission):
-        self._draw_text(screen, f"Score: {score}", self.assets.fonts['body'], (40, 40), PALETTE['text_light'], center=False)
-        self._draw_text(screen, f"Best: {high_score}", self.assets.fonts['small'], (40, 80), PALETTE['text_light'], center=False)
+    def _draw_label_value(self, screen: pygame.Surface, label: str, value: int, font: pygame.font.Font,
+                          pos: tuple, color):
+        """Draws a label followed by a number built from cached digit glyphs, so an ever-changing score never misses the cache."""
+        label_surf = self._render_cached(font, label, color)
+        screen.blit(label_surf, pos)
+        x = pos[0] + label_surf.get_width()
+        for digit in str(value):
+            glyph = self._render_cached(font, digit, color)
+            screen.blit(glyph, (x, pos[1]))
+            x += glyph.get_width()
+
+    def draw_playing_ui(self, screen: pygame.Surface, score: int, high_score: int, snake: Snake, mission, now: int):
+        self._draw_label_value(screen, "Score: ", score, self.assets.fonts['body'], (40, 40), PALETTE['text_light'])
+        self._draw_label_value(screen, "Best: ", high_score, self.assets.fonts['small'], (40, 80), PALETTE['text_light'])
 
         # Mission UI
         mission_text = f"Mission: {mission['text']} ({mission['progress']}/{mission['target']})"
@@ -444,7 +679,7 @@ class UIManager:
 
         # Draw active power-ups
         for i, (ptype, end_time) in enumerate(snake.active_power_ups.items()):
-            remaining_time = (end_time - pygame.time.get_ticks()) / 1000
+            remaining_time = (end_time - now) / 1000
             icon = self.assets.power_up_surfaces[ptype]
             screen.blit(icon, (SCREEN_WIDTH - 200, 40 + i * 50))
             self._draw_text(screen, f"{remaining_time:.1f}s", self.assets.fonts['small'], (SCREEN_WIDTH - 120, 55 + i * 50), PALETTE['text_light'])
@@ -520,34 +755,61 @@ class Game:
         pygame.mixer.init()
         self.screen = pygame.display.set_mode(resolution)
         pygame.display.set_caption("Vibrant Snake")
+        pygame.event.set_blocked(None) # SDL drops every other event type before it reaches the queue
+        pygame.event.set_allowed(list(HANDLED_EVENTS))
         self.clock = pygame.time.Clock()
+        self.now, self.dt = pygame.time.get_ticks(), 0
+        self.frame_costs: deque = deque(maxlen=FPS) # ms of work per frame, excluding the tick wait
+        self.frame_count = 0
         self.assets = AssetManager()
+        self.assets.finalize_surfaces()
         self.ui_manager = UIManager(self.assets)
         self.game_state: str = ""
         self.score: int = 0
         self.player_data = self.load_player_data()
+        # Saves are written by a background thread so disk I/O never stalls a frame
+        self.save_queue: queue.Queue = queue.Queue()
+        self.save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self.save_thread.start()
         self.high_score = self.player_data['high_score']
         self.difficulty: str = "Normal"
+        self._difficulty_idx = _DIFF_KEYS.index(self.difficulty)
         self.color_blind_mode: bool = False
         self.slow_mode: bool = False
         self.is_muted: bool = False
         self.snake: Optional[Snake] = None
         self.food: Optional[Food] = None
+        self.free_cells: set[Cell] = set()
         self.power_ups: list[PowerUp] = []
-        self.particles: list[Particle] = []
+        self.particles = ParticleSystem()
         self.new_high_score = False
         self.current_mission = {}
         self.current_skin = self.player_data['current_skin']
         
-        self.bouncy_walls = []
+        self.bouncy_walls: frozenset[Cell] = frozenset()
         self.generate_bouncy_walls()
 
+        # Full-size overlay surfaces whose content never changes are built once and reused
+        self.play_area_surf = self._mk(self.get_play_area_rect().size)
+        self.play_area_surf.fill(PALETTE['grid_background'] + (200,))
+        self.pause_overlay = self._mk(self.screen.get_size(), alpha=False)
+        self.pause_overlay.fill((0, 0, 0)); self.pause_overlay.set_alpha(150)
+        self.transition_surf = self._mk(self.screen.get_size(), alpha=False)
+        self.transition_surf.fill((0, 0, 0))
+        self.scene_snapshot: Optional[pygame.Surface] = None # Dimmed frozen scene behind the pause/game over menus
+
         self.transition_alpha = 255
         self.combo_timer, self.combo_count, self.screen_shake_timer, self.power_up_spawn_timer = 0, 0, 0, 0
         self.set_state("start_menu")
 
+    @staticmethod
+    def _mk(size: Tuple[int, int], alpha: bool = True) -> pygame.Surface:
+        """Creates a surface already in the display's pixel format, so blitting it never converts."""
+        return pygame.Surface(size, pygame.SRCALPHA).convert_alpha() if alpha else pygame.Surface(size).convert()
+
     def set_state(self, new_state: str):
         self.game_state = new_state
+        self.scene_snapshot = None
         if new_state == "start_menu":
             self.ui_manager.setup_start_menu(
                 difficulty=self.difficulty, cb_mode=self.color_blind_mode, slow_mode=self.slow_mode, is_muted=self.is_muted,
@@ -567,16 +829,18 @@ class Game:
         """Initializes a new game session."""
         play_area = self.get_play_area_rect()
         self.snake = Snake(play_area)
-        self.food = Food(play_area, self.snake.body)
+        self.free_cells = {(x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)}
+        self.free_cells.difference_update(self.snake.body)
+        self.food = Food(play_area, self.free_cells)
         self.power_ups.clear(); self.particles.clear()
         self.score = 0; self.new_high_score = False
         speed = DIFFICULTY_LEVELS[self.difficulty]['speed']
         self.snake_update_interval = 1000 / (speed * 0.5 if self.slow_mode else speed)
-        self.last_snake_update = pygame.time.get_ticks()
+        self.step_accumulator = 0
         self.generate_mission()
         self.set_state("playing")
         self.combo_timer, self.combo_count = 0, 0
-        self.power_up_spawn_timer = pygame.time.get_ticks()
+        self.power_up_spawn_timer = self.now
         
     def get_play_area_rect(self) -> pygame.Rect:
         return pygame.Rect((self.screen.get_width() - GRID_WIDTH * TILE_SIZE) // 2,
@@ -590,85 +854,129 @@ class Game:
             
         running = True
         while running:
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT: running = False
-                self.handle_input(event)
+            events = []
+            redraw = True
+            idle = self.game_state != "playing" and self.transition_alpha <= 0 and not self.ui_manager.is_animating()
+            if idle:
+                # Nothing is animating on a menu, so sleep until input arrives instead of spinning.
+                # The waking event is the oldest one, so it leads the frame's batch.
+                event = pygame.event.wait(MENU_IDLE_WAIT)
+                if event.type != pygame.NOEVENT: events.append(event)
+                # On a timeout only the drifting stars can have changed; the frozen pause/game over scene can't
+                else: redraw = self.scene_snapshot is None
+            running = self.handle_inputs(self.collect_events(events))
             self.update()
-            self.render()
-            self.clock.tick(FPS)
+            if redraw: self.render()
+            if sum(self.frame_costs) > 0.8 * FRAME_BUDGET * len(self.frame_costs):
+                self.dt = self.clock.tick_busy_loop(FPS) # Little slack left: a coarse sleep would overshoot it
+            else:
+                self.dt = self.clock.tick(FPS)
+            # Frame timing is sampled once here and shared by everything in the next frame
+            self.now = pygame.time.get_ticks()
+            # The clock has already measured the work outside its own delay; an idle wait isn't work
+            if not idle: self.frame_costs.append(self.clock.get_rawtime())
+            if self.dt > STALL_PAUSE_MS and self.game_state == "playing": self.set_state("paused")
         self.save_player_data()
+        self.save_queue.put(None) # Let the writer finish the pending save, then stop
+        self.save_thread.join(timeout=2)
         pygame.quit()
         sys.exit()
 
-    def handle_input(self, event):
-        if self.game_state in ["start_menu", "game_over", "paused", "customize"]:
-            self.ui_manager.handle_events(event)
-        if event.type != pygame.KEYDOWN: return
-        if event.key == pygame.K_m: self.toggle_mute()
-        
-        if self.game_state == "playing":
-            if event.key in [pygame.K_p, pygame.K_ESCAPE]: self.set_state("paused")
-            dir_map = {
-                (pygame.K_UP, pygame.K_w): pygame.Vector2(0, -1), (pygame.K_DOWN, pygame.K_s): pygame.Vector2(0, 1),
-                (pygame.K_LEFT, pygame.K_a): pygame.Vector2(-1, 0), (pygame.K_RIGHT, pygame.K_d): pygame.Vector2(1, 0),
-            }
-            for keys, direction in dir_map.items():
-                if event.key in keys and (self.snake.direction.length() == 0 or self.snake.direction.dot(direction) == 0):
-                    self.snake.direction = direction; break
+    def collect_events(self, events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+        """Drains the queue with a single pump, keeping events in the order they happened.
+
+        SDL only queues HANDLED_EVENTS (see Game.__init__). Hover is idempotent, so a run of
+        consecutive pointer motions collapses to its last one.
+        """
+        batch = []
+        for event in events + pygame.event.get():
+            if event.type == pygame.MOUSEMOTION and batch and batch[-1].type == pygame.MOUSEMOTION: batch[-1] = event
+            else: batch.append(event)
+        return batch
+
+    def handle_inputs(self, events: List[pygame.event.Event]) -> bool:
+        """Dispatches a frame's batch of events. Returns False once the window is closed."""
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT: running = False
+            if self.game_state in ["start_menu", "game_over", "paused", "customize"]:
+                self.ui_manager.handle_events(event)
+            if event.type != pygame.KEYDOWN: continue
+            if event.key == pygame.K_m: self.toggle_mute()
+            
+            if self.game_state == "playing":
+                if event.key in [pygame.K_p, pygame.K_ESCAPE]: self.set_state("paused")
+                direction = KEY_DIRECTIONS.get(event.key)
+                # Only allow turning at right angles (or starting to move), never reversing
+                if direction and self.snake.direction[0] * direction[0] + self.snake.direction[1] * direction[1] == 0:
+                    self.snake.direction = direction
+        return running
 
     def update(self):
         if self.game_state != "playing": return
-        now = pygame.time.get_ticks()
-        if now - self.last_snake_update > self.snake_update_interval:
-            self.snake.update(); self.last_snake_update = now
+        # Fixed timestep: the snake steps once per elapsed interval, catching up (a little) after slow frames
+        self.step_accumulator = min(self.step_accumulator + self.dt, 3 * self.snake_update_interval)
+        while self.step_accumulator >= self.snake_update_interval:
+            self.step_accumulator -= self.snake_update_interval
+            if not self.update_logic(): return
+        self.update_anim()
+
+    def update_logic(self) -> bool:
+        """Runs one snake step: movement, pickups, collisions and spawning. Returns False on game over."""
+        moved = self.snake.update()
+        if moved:
+            head, tail = moved
+            self.free_cells.discard(head)
+            if tail is not None: self.free_cells.add(tail)
         
-        if self.snake.get_head_position() == self.food.position: self.eat_food()
+        head = self.snake.get_head_position()
+        if head == self.food.position: self.eat_food()
         
-        for p_up in self.power_ups[:]:
-            if self.snake.get_head_position() == p_up.position:
-                self.snake.add_power_up(p_up.type)
-                self.power_ups.remove(p_up)
-                if self.assets.sounds.get('powerup'): self.assets.sounds['powerup'].play()
+        collected = [p_up for p_up in self.power_ups if p_up.position == head]
+        if collected:
+            self.power_ups = [p_up for p_up in self.power_ups if p_up.position != head]
+            for p_up in collected: self.snake.add_power_up(p_up.type, self.now)
+            if self.assets.sounds.get('powerup'): self.assets.sounds['powerup'].play()
         
         collision_type = self.snake.check_collision(self.bouncy_walls)
         if collision_type == "bounce": self.handle_bounce()
-        elif collision_type is not None: self.game_over(); return
-        
-        if self.combo_timer > 0: self.combo_timer -= self.clock.get_time()
+        elif collision_type is not None: self.game_over(); return False
+        self.spawn_power_ups(self.now)
+        return True
+
+    def update_anim(self):
+        """Runs every frame: combo/shake timers, power-up countdowns, the snake's expression and particles."""
+        if self.combo_timer > 0: self.combo_timer -= self.dt
         else: self.combo_count = 0
-        if self.screen_shake_timer > 0: self.screen_shake_timer -= self.clock.get_time()
+        if self.screen_shake_timer > 0: self.screen_shake_timer -= self.dt
         
-        self.update_snake_expression()
-        self.snake.update_power_ups()
-        self.spawn_power_ups()
-        for p in self.particles[:]:
-            p.update()
-            if not p.alive: self.particles.remove(p)
+        self.frame_count += 1
+        if not self.frame_count & 3: self.update_snake_expression() # eyes don't need 60 Hz
+        self.snake.update_power_ups(self.now)
+        self.particles.update()
 
     def eat_food(self):
         self.player_data['total_food_eaten'] += 1
         self.update_mission(self.food.type)
         self.snake.grow()
         self.score += 10
-        self.food.randomize_position(self.snake.body)
+        self.food.randomize_position(self.free_cells, tuple(p_up.position for p_up in self.power_ups))
         if self.assets.sounds.get('eat'): self.assets.sounds['eat'].play()
         
-        for _ in range(20): self.particles.append(Particle(self.snake.get_head_pixel_pos(self.get_play_area_rect().topleft), self.food.color))
+        self.particles.spawn(self.snake.get_head_pixel_pos(self.get_play_area_rect().topleft), self.food.color, 20)
 
         self.combo_count = self.combo_count + 1 if self.combo_timer > 0 else 1
         self.combo_timer = COMBO_WINDOW
         
-        if self.combo_count >= 3:
-            self.score += 30; self.combo_count = 0; self.screen_shake_timer = SCREEN_SHAKE_DURATION
+        if self.combo_count >= COMBO_THRESHOLD:
+            self.score += COMBO_BONUS; self.combo_count = 0; self.screen_shake_timer = SCREEN_SHAKE_DURATION
             self.snake.eye_state = 'dizzy'; self.snake.dizzy_timer = 30 # half a second
             if self.assets.sounds.get('combo'): self.assets.sounds['combo'].play()
 
-    def spawn_power_ups(self):
-        now = pygame.time.get_ticks()
+    def spawn_power_ups(self, now: int):
         rate = DIFFICULTY_LEVELS[self.difficulty]['powerup_spawn_rate']
         if now - self.power_up_spawn_timer > rate and len(self.power_ups) < 2:
-            self.power_ups.append(PowerUp(self.get_play_area_rect(), self.snake.body + [self.food.position]))
+            self.power_ups.append(PowerUp(self.get_play_area_rect(), self.free_cells, (self.food.position,)))
             self.power_up_spawn_timer = now
 
     def game_over(self):
@@ -678,9 +986,8 @@ class Game:
             self.player_data['high_score'] = self.score
             self.new_high_score = True
             if self.assets.sounds.get('new_highscore'): self.assets.sounds['new_highscore'].play()
-            for _ in range(100):
-                self.particles.append(Particle((random.randint(0, SCREEN_WIDTH), random.randint(0,SCREEN_HEIGHT)), 
-                    (random.randint(200,255), random.randint(200,255), random.randint(200,255)), lifespan=120))
+            self.particles.spawn(rng.integers(0, (SCREEN_WIDTH + 1, SCREEN_HEIGHT + 1), size=(100, 2)),
+                                 rng.integers(200, 256, size=(100, 3)), 100, lifespan=120)
         self.check_unlocks()
         self.save_player_data()
         self.set_state("game_over")
@@ -700,9 +1007,26 @@ class Game:
         except (FileNotFoundError, json.JSONDecodeError): return default_data
 
     def save_player_data(self):
-        try:
-            with open("player_data.json", "w") as f: json.dump(self.player_data, f, indent=4)
-        except IOError: print("Error saving player data.")
+        """Queues a snapshot of the player data for the background writer."""
+        self.save_queue.put(copy.deepcopy(self.player_data))
+
+    def _save_worker(self):
+        running = True
+        while running:
+            data = self.save_queue.get()
+            # Only the newest snapshot matters; skip any that queued up behind it
+            while not self.save_queue.empty():
+                newer = self.save_queue.get_nowait()
+                if newer is None: running = False
+                else: data = newer
+            if data is None: break
+            try:
+                with open("player_data.json.tmp", "w") as f: json.dump(data, f, separators=(",", ":")) # Machine-read only, so compact
+                os.replace("player_data.json.tmp", "player_data.json") # Atomic, never leaves a half-written file
+            except Exception as e: # Keep the writer alive, or every later save would silently pile up
+                print(f"Error saving player data: {e!r}")
+                try: os.remove("player_data.json.tmp")
+                except OSError: pass
 
     def check_unlocks(self):
         if self.high_score >= 100 and not self.player_data['unlocks']['skins']['Tiger']:
@@ -711,23 +1035,25 @@ class Game:
             self.player_data['unlocks']['skins']['Rainbow'] = True
 
     def generate_bouncy_walls(self):
-        self.bouncy_walls.clear()
+        walls = []
         for i in range(5):
-            self.bouncy_walls.append(pygame.Vector2(0, GRID_HEIGHT // 2 - 2 + i))
-            self.bouncy_walls.append(pygame.Vector2(GRID_WIDTH - 1, GRID_HEIGHT // 2 - 2 + i))
+            walls.append((0, GRID_HEIGHT // 2 - 2 + i))
+            walls.append((GRID_WIDTH - 1, GRID_HEIGHT // 2 - 2 + i))
+        self.bouncy_walls = frozenset(walls)
 
     def handle_bounce(self):
         head = self.snake.get_head_position()
-        if head.x == 0: self.snake.direction.x = 1
-        elif head.x == GRID_WIDTH - 1: self.snake.direction.x = -1
+        if head[0] == 0: self.snake.direction = (1, self.snake.direction[1])
+        elif head[0] == GRID_WIDTH - 1: self.snake.direction = (-1, self.snake.direction[1])
         if self.assets.sounds.get('bounce'): self.assets.sounds['bounce'].play()
 
     def update_snake_expression(self):
         if self.snake.eye_state == 'dizzy': return
         is_near_powerup = False
-        head = self.snake.get_head_position()
+        hx, hy = self.snake.get_head_position()
         for p_up in self.power_ups:
-            if head.distance_to(p_up.position) < 4:
+            px, py = p_up.position
+            if (hx - px) ** 2 + (hy - py) ** 2 < 16: # within 4 tiles, compared squared in ints
                 is_near_powerup = True; break
         self.snake.eye_state = 'wide' if is_near_powerup else 'normal'
 
@@ -756,56 +1082,61 @@ class Game:
             if self.assets.sounds.get('mission_complete'): self.assets.sounds['mission_complete'].play()
     
     def draw_background(self):
-        self.screen.fill(PALETTE['background'])
-        stars = self.assets.backgrounds['stars']
-        for star in stars:
-            star[0] -= star[2] * 0.5
-            if star[0] < 0:
-                star[0] = SCREEN_WIDTH; star[1] = random.randint(0, SCREEN_HEIGHT)
-            pygame.draw.circle(self.screen, (255, 255, 255), (star[0], star[1]), star[2])
+        self.screen.blit(self.assets.backgrounds['sky'], (0, 0))
+        star_x, star_y, star_size = (self.assets.backgrounds[key] for key in ('star_x', 'star_y', 'star_size'))
+        star_x -= star_size * (0.5 * self.dt * FPS / 1000) # frame-rate independent, menus redraw less often
+        wrapped = star_x < 0
+        if wrapped.any():
+            star_x[wrapped] = SCREEN_WIDTH
+            star_y[wrapped] = rng.integers(0, SCREEN_HEIGHT + 1, np.count_nonzero(wrapped))
+        sprites = self.assets.backgrounds['star_sprites']
+        self.screen.blits([(sprites[size], (x - size, y - size))
+                           for x, y, size in zip(star_x.tolist(), star_y.tolist(), star_size.tolist())], doreturn=False)
 
     def render(self):
         offset = (random.randint(-S, S), random.randint(-S, S)) if (S:=SCREEN_SHAKE_INTENSITY) and self.screen_shake_timer > 0 else (0,0)
-        self.draw_background()
+        if self.scene_snapshot is not None:
+            self.screen.blit(self.scene_snapshot, (0, 0))
+        else:
+            self.draw_background()
 
         if self.game_state == "start_menu": self.ui_manager.draw_start_menu(self.screen)
         elif self.game_state == "customize": self.ui_manager.draw_customize_menu(self.screen, self.current_skin)
+        elif self.game_state == "playing": self.render_playing(offset)
         else:
-            self.render_playing(offset)
-            overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-            if self.game_state in ["paused", "game_over"]:
-                overlay.fill((0, 0, 0, 150)); self.screen.blit(overlay, (0,0))
+            if self.scene_snapshot is None:
+                # Nothing in the scene updates behind these menus, so it is composited only once
+                self.render_playing((0, 0)) # Never freeze a shaken frame
+                self.screen.blit(self.pause_overlay, (0,0))
+                self.scene_snapshot = self.screen.copy()
             if self.game_state == "paused": self.ui_manager.draw_paused_menu(self.screen)
             elif self.game_state == "game_over": self.ui_manager.draw_game_over_menu(self.screen, self.score, self.high_score, self.new_high_score)
         
         if self.transition_alpha > 0:
             self.transition_alpha -= 15
-            transition_surf = pygame.Surface(self.screen.get_size()); transition_surf.fill((0,0,0))
-            transition_surf.set_alpha(self.transition_alpha); self.screen.blit(transition_surf, (0,0))
+            self.transition_surf.set_alpha(self.transition_alpha); self.screen.blit(self.transition_surf, (0,0))
 
         pygame.display.flip()
 
     def render_playing(self, offset: Tuple[int, int]):
         play_area_rect = self.get_play_area_rect()
-        play_area_surf = pygame.Surface(play_area_rect.size, pygame.SRCALPHA)
-        play_area_surf.fill(PALETTE['grid_background'] + (200,))
-        self.screen.blit(play_area_surf, play_area_rect.topleft)
+        self.screen.blit(self.play_area_surf, play_area_rect.topleft)
         
         origin = play_area_rect.topleft
         # Draw bouncy walls
-        for wall_pos in self.bouncy_walls:
-             pygame.draw.rect(self.screen, PALETTE['bouncy_wall'], (origin[0] + wall_pos.x * TILE_SIZE, origin[1] + wall_pos.y * TILE_SIZE, TILE_SIZE, TILE_SIZE), border_radius=5)
+        wall_surf = self.assets.tile_surfaces['bouncy_wall']
+        self.screen.blits([(wall_surf, (origin[0] + GRID_X_PIXELS[x], origin[1] + GRID_Y_PIXELS[y])) for x, y in self.bouncy_walls], doreturn=False)
 
         self.snake.draw(self.screen, self.assets, origin, offset, self.current_skin, self.color_blind_mode)
         self.food.draw(self.screen, self.assets, origin, offset)
         for p_up in self.power_ups: p_up.draw(self.screen, self.assets, origin, offset)
-        for p in self.particles: p.draw(self.screen, offset)
+        self.particles.draw(self.screen, self.assets, offset)
 
-        self.ui_manager.draw_playing_ui(self.screen, self.score, self.high_score, self.snake, self.current_mission)
+        self.ui_manager.draw_playing_ui(self.screen, self.score, self.high_score, self.snake, self.current_mission, self.now)
     
     def toggle_difficulty(self):
-        levels = list(DIFFICULTY_LEVELS.keys())
-        self.difficulty = levels[(levels.index(self.difficulty) + 1) % len(levels)]
+        self._difficulty_idx = (self._difficulty_idx + 1) % len(_DIFF_KEYS)
+        self.difficulty = _DIFF_KEYS[self._difficulty_idx]
         self.set_state("start_menu")
 
     def toggle_cb_mode(self): self.color_blind_mode = not self.color_blind_mode; self.set_state("start_menu")